@@ -1,19 +1,33 @@
 """
 Tomato - a timetracker app with a CLI.
 """
-from importlib.metadata import version
+import importlib
 from pathlib import Path
+from typing import Any, TYPE_CHECKING
 
-import structlog
+from ._version import __version__  # noqa: F401
 
-# Inmports of convenience
-from . import etc  # noqa: F401
-from . import log
+if TYPE_CHECKING:
+    # Imports of convenience, at runtime these are imported on first use.
+    from . import etc, log  # noqa: F401
 
 # from . import times
 
 __app_name__ = __package__
-__version__ = version(__package__)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the `etc` and `log` modules on first use.
+
+    This keeps `import tomato` light for the CLI paths not needing the configuration
+    or logger, like `--version`.
+    """
+
+    if name in ("etc", "log"):
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def init(loglevel_name: str | None = None, logfile: Path | None = None) -> None:
@@ -24,20 +38,23 @@ def init(loglevel_name: str | None = None, logfile: Path | None = None) -> None:
         `log`   : Logger
         `times` : Registered times
     """
+    import structlog
+
+    from . import etc, log  # noqa: F811
+
     etc.init(reload=True)
 
+    # Look up the table once, then pick the keys from it.
+    logging_etc: dict[str, Any] = etc.get("logging", default_value={})
+
     if not loglevel_name:
-        loglevel_name = etc.get("logging.level", default_value=None)
+        loglevel_name = logging_etc.get("level", None)
 
     if not logfile:
-        logfile = etc.get("logging.logfile", default_value=None)
+        logfile = logging_etc.get("logfile", None)
 
     log.init(loglevel_name, logfile)
     # times.init(etc.data)
     # print(etc.data["tool"]["black"]["exclude"])
 
-    structlog.get_logger().debug("Initialised", etc=etc.data)
-
-
-# not further used, clean the scope
-del version
+    structlog.get_logger(__name__).debug("Initialised", etc=etc.data)
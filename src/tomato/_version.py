@@ -0,0 +1,20 @@
+"""
+Version of the installed package, kept apart so it is available without importing
+the rest of `tomato`.
+
+The placeholder is replaced on build by `poetry-dynamic-versioning`, development
+installs fall back to the version in the installed metadata.
+"""
+
+__version__: str = "0.0.0"
+
+if __version__ == "0.0.0":
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        __version__ = version(__package__)
+    except PackageNotFoundError:
+        pass
+
+    # not further used, clean the scope
+    del PackageNotFoundError, version
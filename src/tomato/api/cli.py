@@ -3,12 +3,17 @@ Tomato - a CLI for a timetracker application
 """
 import os
 from pathlib import Path
+from typing import Final
 
-import structlog
 import typer
 
 import tomato
 
+# Accepted log levels, checked here to not import `tomato.log` for it.
+_VALID_LEVELS: Final[frozenset[str]] = frozenset(
+    {"DEBUG", "INFO", "WARNING", "WARN", "ERROR", "CRITICAL"}
+)
+
 app: typer.Typer = typer.Typer(
     add_help_option=True,
     help=__doc__,
@@ -32,11 +37,7 @@ def _log_level_callback(value: str) -> str | None:
     if not value:
         # Fail quick on empties
         return None
-    elif (
-        isinstance(value, str)
-        and (value := value.strip().upper())
-        and tomato.log.loglevel_from_str(value)
-    ):
+    elif isinstance(value, str) and (value := value.strip().upper()) in _VALID_LEVELS:
         # A non-empty string matching a log level
         return value
 
@@ -105,6 +106,8 @@ def main(
 
     This callback is always run before any command.
     """
+    import structlog
+
     tomato.init(loglevel_name=log, logfile=logfile)
 
     logger: structlog.BoundLogger = structlog.get_logger(tomato.__app_name__)
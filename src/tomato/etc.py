@@ -16,15 +16,17 @@ TODO:
 - Provide dotted get/set() methods
 """
 
+import copy
+import functools
 import os
+import tomllib
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
-import dotenv
 import structlog
-import tomlkit
 
-from tomato.utils import filter_paths
+from tomato.utils import filter_paths_with_stat, merge_dicts, stat_or_none
 
 # Files where the configuration is expected.
 DEFAULT_FILE: Final[str] = r"./var/etc/defaults.toml"
@@ -34,12 +36,25 @@ OS_ENV_KEY: Final[str] = "TOMATO_ETC_FILE"
 OS_ENV_KEY_SPLIT: Final[str] = ";"
 DEFAULT_VALUE = object()
 
+# Absolute paths of the fixed files, `$HOME` does not change while running.
+_DEFAULT_FILE_PATH: Final[Path] = Path(os.path.abspath(DEFAULT_FILE))
+_USER_FILE_PATH: Final[Path] = Path(os.path.expanduser(USER_FILE))
+
+# Maximum number of parsed files kept in `_PARSE_CACHE`.
+PARSE_CACHE_SIZE: Final[int] = 8
+
 # Get the logger, note that configuration only takes place after
 # the configuration is loaded.
 logger: structlog.stdlib.BoundLogger = structlog.getLogger(__name__)
 
 # The writable configuration container
-data: tomlkit.TOMLDocument = None
+data: dict[str, Any] = None
+
+# Parsed files, keyed on the path and holding `(st_mtime_ns, st_size, document)`.
+_PARSE_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+# Files, with their `st_mtime_ns` and `st_size`, which made up the loaded `data`.
+_LAST_FINGERPRINT: tuple[tuple[Path, int, int], ...] | None = None
 
 
 def init(reload: bool = False) -> None:
@@ -49,19 +64,39 @@ def init(reload: bool = False) -> None:
     When called multiple times, the found data replaces any previously set information.
     When called with `reload=True`, all previously existing configuration data is
     replaced with the newly found information.
+
+    Without `reload`, nothing is loaded when the same files are found and none of them
+    changed since the last time.
     """
-    global data
+    global data, _LAST_FINGERPRINT
+
+    if reload:
+        _dotenv_values.cache_clear()
+        _parse_env_files.cache_clear()
 
     found_files: list[Path] = _gather_files()
-    found_data: tomlkit.TOMLDocument
+    found_stats: list[tuple[Path, os.stat_result]] = filter_paths_with_stat(
+        *found_files
+    )
+    filtered_files: list[Path] = [fn for fn, _ in found_stats]
+    fingerprint: tuple[tuple[Path, int, int], ...] = _fingerprint(found_stats)
+    found_data: dict[str, Any] = {}
 
-    if not (filtered_files := filter_paths(*found_files)):
+    if not reload and data is not None and fingerprint == _LAST_FINGERPRINT:
+        logger.debug("Etc files unchanged, not loaded", files=filtered_files)
+        return
+
+    if not filtered_files:
         logger.warning(
             "No configuration files found, not even the default file.",
             files=found_files,
         )
 
-    elif not (found_data := _load_files(*filtered_files)):
+    elif not (
+        found_data := _load_files(
+            *filtered_files, states=[fp[1:] for fp in fingerprint]
+        )
+    ):
         logger.warning(
             "No configuration data found from the found files.", files=filtered_files
         )
@@ -69,22 +104,41 @@ def init(reload: bool = False) -> None:
     else:
         logger.debug("Etc files loaded", files=filtered_files)
 
-    if not data or reload or not isinstance(data, tomlkit.TOMLDocument):
+    if not data or reload or not isinstance(data, dict):
         data = found_data
     else:
-        data.update(found_data)
+        merge_dicts(data, found_data)
+
+    _LAST_FINGERPRINT = fingerprint
 
 
 def _gather_files() -> list[Path]:
-    """Get the config files in the order to load them, including dotenv files."""
+    """
+    Get the config files in the order to load them, including dotenv files.
+
+    Paths are made absolute, but not resolved, as following symlinks is not needed
+    to open the files and costs a look-up per path component.
+    """
 
     return [
-        Path(DEFAULT_FILE),
-        Path(USER_FILE),
+        _DEFAULT_FILE_PATH,
+        _USER_FILE_PATH,
         *_files_from_env(),
     ]
 
 
+def _fingerprint(
+    found_stats: Iterable[tuple[Path, os.stat_result]]
+) -> tuple[tuple[Path, int, int], ...]:
+    """
+    Identify the files, in order, and their state by modification time and size.
+
+    Uses the `os.stat` results of `filter_paths_with_stat`, not stat'ing them again.
+    """
+
+    return tuple((fn, st.st_mtime_ns, st.st_size) for fn, st in found_stats)
+
+
 def _files_from_env(
     env_key: str = OS_ENV_KEY,
     dotenv_fn: str = DOTENV_FILE,
@@ -120,12 +174,14 @@ def _files_from_env(
         env_value=env_value,
     )
 
-    # Split environmental key on `split_on`
-    cfg_fns: list[Path] = []
-    for fn in env_value.split(sep=split_on):
-        cfg_fns.append(Path(fn.strip()))
+    return list(_parse_env_files(env_value, split_on))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_env_files(env_value: str, split_on: str) -> tuple[Path, ...]:
+    """Split environmental key on `split_on`, parsing the same value only once."""
 
-    return cfg_fns
+    return tuple(Path(fn.strip()) for fn in env_value.split(sep=split_on))
 
 
 def _key_from_dotenv(dotenv_fn: str, env_key: str) -> str | None:
@@ -134,51 +190,110 @@ def _key_from_dotenv(dotenv_fn: str, env_key: str) -> str | None:
 
     The value is loaded directly into `os.environ`.
     """
+
+    # Check if the key is there or return `None`
+    return _dotenv_values(dotenv_fn).get(env_key, None)
+
+
+@functools.lru_cache(maxsize=4)
+def _dotenv_values(dotenv_fn: str) -> dict[str, str | None]:
+    """
+    Find and load all values from a dotenv file.
+
+    The file is searched for and parsed only once, until `init(reload=True)` clears
+    the cache.
+    """
+    import dotenv
+
     fn: Path | str | None
 
     # Find the dot env file
     if not (fn := dotenv.find_dotenv(dotenv_fn)):
-        return None
+        return {}
 
     # Load the values
-    c: dict[str, str | None] = dotenv.dotenv_values(fn, interpolate=True)
+    return dotenv.dotenv_values(fn, interpolate=True)
 
-    # Check if the key is there or return `None`
-    return c.get(env_key, None)
 
+def _load_files(
+    *files: Path, states: Sequence[tuple[int, int]] | None = None
+) -> dict[str, Any]:
+    """
+    Load configurations from multiple files.
+
+    Tables are merged, so a later file only overrides the keys it sets. Files that
+    cannot be read are skipped, except for the `DEFAULT_FILE` with the basic values.
+
+    The `states` of the files, see `_load_file`, are passed on when already known.
+    """
 
-def _load_files(*files: Path) -> tomlkit.TOMLDocument:
-    """Load configurations from multiple files."""
+    loaded_data: dict[str, Any] = {}
+    for i, fn in enumerate(files):
+        try:
+            merge_dicts(loaded_data, _load_file(fn, states[i] if states else None))
 
-    loaded_data: tomlkit.TOMLDocument = tomlkit.document()
-    for fn in files:
-        loaded_data.update(_load_file(fn))
+        except PermissionError as e:
+            if fn == _DEFAULT_FILE_PATH:
+                raise
+
+            logger.warning(
+                "No read permission to configuration file, skipped.", etc_fn=fn, e=e
+            )
 
     return loaded_data
 
 
-def _load_file(fn: Path) -> tomlkit.TOMLDocument:
-    """Load configuration from one file."""
+def _load_file(fn: Path, state: tuple[int, int] | None = None) -> dict[str, Any]:
+    """
+    Load configuration from one file.
+
+    Parsed documents are cached on the modification time and size of the file, so
+    an unchanged file is only parsed once. A copy is returned as the documents are
+    mutable and would otherwise change the cached version when updated.
+
+    The `state`, `(st_mtime_ns, st_size)`, is only stat'ed when not passed.
+    """
+
+    if state is None:
+        st: os.stat_result = os.stat(fn)
+        state = (st.st_mtime_ns, st.st_size)
+
+    if (cached := _PARSE_CACHE.get(fn)) and cached[:2] == state:
+        return copy.deepcopy(cached[2])
+
+    doc: dict[str, Any] = tomllib.loads(fn.read_bytes().decode("utf-8"))
 
-    with fn.open(mode="rb") as fp:
-        return tomlkit.load(fp)
+    if fn not in _PARSE_CACHE and len(_PARSE_CACHE) >= PARSE_CACHE_SIZE:
+        # Drop the oldest entry, dicts keep their insertion order.
+        del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+
+    _PARSE_CACHE[fn] = (*state, doc)
+
+    return copy.deepcopy(doc)
 
 
 def write(to: Path) -> None:
-    """Write configuration data to the given file."""
+    """
+    Write configuration data to the given file.
+
+    Only writing needs `tomlkit`, loading is done with the faster `tomllib`.
+    """
+    import tomlkit
 
     try:
-        with to.open(mode="wb") as fp:
+        with to.open(mode="w", encoding="utf-8") as fp:
             tomlkit.dump(data=data, fp=fp, sort_keys=False)  # type: ignore
 
     except PermissionError as e:
-        if to.exists() and not os.access(to, mode=os.W_OK):
+        # Opening a missing file in a missing directory raises `FileNotFoundError`,
+        # so either the file or its directory is not writable.
+        if stat_or_none(to) is not None:
             logger.exception(
                 "No write permission to existing configuration file.",
                 etc_fn=to,
                 e=e,
             )
-        elif to.parent.exists() and not os.access(to.parent, os.W_OK):
+        else:
             logger.exception(
                 "No write permission to the directory of the planned."
                 "configuration file.",
@@ -207,31 +322,45 @@ def get(*keys: str, default_value: ... = DEFAULT_VALUE) -> ...:
     if not keys:
         raise TypeError("Missing at least one required `key`.")
 
-    elif len(keys) == 1 and isinstance(keys[0], str) and "." in keys[0]:
-        # Check for dots in a the single passed `keys`, split on the dot
-        keys = keys[0].split(".")
+    try:
+        return _get_keys(keys)
 
-    # Prepare the data source
-    d = data
+    except KeyError:
+        # So if the key doesn't exist, return the default when passed.
+        if default_value is not DEFAULT_VALUE:
+            return default_value
 
-    # Loop over the keys and try each one in succession on the previous key.
-    for key in keys:
-        if isinstance(key, str) and key.isdigit():
-            key = int(key)
+        raise
 
-        try:
-            d = d[key]
 
-        except KeyError:
-            # So if the key doesn't exist, return the default when passed.
-            if default_value is not DEFAULT_VALUE:
-                return default_value
+def _get_keys(keys: tuple) -> ...:
+    """Look up the value of `keys`, either a single dotted key or separate keys."""
+
+    if len(keys) == 1 and isinstance(keys[0], str) and "." in keys[0]:
+        return _get_dotted(keys[0])
+
+    return _get_tuple(keys)
+
+
+def _get_dotted(key: str) -> ...:
+    """Look up a single dotted key, like `logging.level`."""
+
+    # Split on the dot only once, outside the loop over the keys.
+    return _get_tuple(key.split("."))
 
-            raise
 
-    # Only return `d` when there were keys.
-    if keys:
-        return d
+def _get_tuple(keys: Iterable) -> ...:
+    """
+    Loop over the keys and try each one in succession on the previous key.
+
+    Digit strings are converted to an index only when looking up in an array.
+    """
+
+    d = data
+    for key in keys:
+        if isinstance(d, list) and isinstance(key, str) and key.isdigit():
+            key = int(key)
+
+        d = d[key]
 
-    # Return default otherwise
-    return default_value
+    return d
@@ -7,7 +7,6 @@ Goal is to have output by this module using `structlog` similar to the stdlib
 `logging` output.
 
 SEE:
-- https://github.com/madzak/python-json-logger
 - https://www.structlog.org/en/stable/index.html
 
 TODO:
@@ -15,47 +14,138 @@ TODO:
 - Clean up options for logging and level settings (`stdout`, but in: `json` or `rich`)
 """
 import datetime
+import functools
 import logging
 import logging.config
+import os
+import socket
 import sys
+import time
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import Any, Final
 
 import structlog
-from pythonjsonlogger.jsonlogger import JsonFormatter  # type: ignore
+from structlog.typing import FilteringBoundLogger
 
 # Fallback values.
 LOG_DT_FMT: Final[str] = "%Y-%m-%d %H:%M:%S"
 LOG_LVL: Final[str] = "INFO"
-LOG_FMT: Final[
-    str
-] = "%(timestamp)s [%(levelname)s] %(name)s: %(message)s (%(pathname)s:%(lineno)d)"
-LOG_FILE: Final[Path] = Path.cwd() / datetime.datetime.today().strftime(
-    f"{__package__} %Y-%m-%d.log"
-)
 
+# Level names accepted for `loglevel_from_str`.
+_LEVELS: Final[dict[str, int]] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Values which do not change per event, see `_add_static_fields`.
+_PID: int = os.getpid()
+_HOST: Final[str] = socket.gethostname()
+_LEVEL_UPPER: Final[dict[str, str]] = {
+    level: level.upper()
+    for level in ("debug", "info", "warning", "error", "critical", "exception")
+}
+
+
+def _reset_pid() -> None:
+    """Update the cached process id in a forked child."""
+    global _PID
+
+    _PID = os.getpid()
+
+
+# Forking, and so `register_at_fork`, is not available on Windows.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pid)
+
+
+# Whether stderr is a terminal, which does not change during the process lifetime.
+_STDERR_ISATTY: Final[bool] = sys.stderr.isatty()
+
+# Loggers returned by `get_logger`, by name.
+_LOGGERS: dict[str, FilteringBoundLogger] = {}
+
+# Bound once for `get_logger`, saving the look-ups on the `structlog` module.
+_is_configured: Final[Callable[[], bool]] = structlog.is_configured
+_structlog_get_logger: Final[Callable[..., Any]] = structlog.get_logger
+
+
+class CachedTimeStamper:
+    """
+    Add the UTC `timestamp`, formatted by `LOG_DT_FMT`.
+
+    As the format has whole seconds, it is only formatted once per second and reused
+    by all events within the same second.
+    """
+
+    __slots__ = ("_fmt", "_last")
+
+    def __init__(self, fmt: str = LOG_DT_FMT) -> None:
+        self._fmt = fmt
+        # Second and its formatted string, swapped as one to be thread safe.
+        self._last: tuple[int, str] = (-1, "")
 
-class StuctlogJsonFormatter(JsonFormatter):  # type: ignore
-    """JSON Formatter to have the output resember that of StructLog"""
+    def __call__(self, _: Any, __: Any, event_dict: dict[str, Any]) -> dict[str, Any]:
+        """Add the timestamp to the event."""
+        second, formatted = self._last
 
-    def add_fields(
-        self,
-        log_record: dict[str, Any],
-        record: logging.LogRecord,
-        message_dict: dict[str, Any],
-    ) -> None:
-        """Ensure several fields are part of the JSON log to be recorded."""
+        if (now := int(time.time())) != second:
+            formatted = time.strftime(self._fmt, time.gmtime(now))
+            self._last = (now, formatted)
 
-        super(self.__class__, self).add_fields(log_record, record, message_dict)
-        if not log_record.get("timestamp"):
-            log_record["timestamp"] = datetime.datetime.utcfromtimestamp(
-                record.created
-            ).strftime(LOG_DT_FMT)
+        event_dict["timestamp"] = formatted
 
-        if log_record.get("level"):
-            log_record["level"] = log_record["level"].upper()
-        else:
-            log_record["level"] = record.levelname
+        return event_dict
+
+
+class NamedBytesLogger(structlog.BytesLogger):
+    """`BytesLogger` with the name it was created for, like the stdlib loggers."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str | None = None, file: Any = None) -> None:
+        super().__init__(file)
+        self.name = name
+
+
+class NamedBytesLoggerFactory:
+    """Produce `NamedBytesLogger`s writing to `file`, `sys.stdout` by default."""
+
+    def __init__(self, file: Any = None) -> None:
+        self._file = file
+
+    def __call__(self, *args: Any) -> NamedBytesLogger:
+        """Create a logger, named by the first argument when given."""
+        return NamedBytesLogger(args[0] if args else None, self._file)
+
+
+class NamedWriteLogger(structlog.WriteLogger):
+    """`WriteLogger` with the name it was created for, like the stdlib loggers."""
+
+    def __init__(self, name: str | None = None, file: Any = None) -> None:
+        super().__init__(file)
+        self.name = name
+
+
+class NamedWriteLoggerFactory(NamedBytesLoggerFactory):
+    """Produce `NamedWriteLogger`s writing to `file`, `sys.stdout` by default."""
+
+    def __call__(self, *args: Any) -> NamedWriteLogger:
+        """Create a logger, named by the first argument when given."""
+        return NamedWriteLogger(args[0] if args else None, self._file)
+
+
+# Processors for both the structlog and stdlib events, built once.
+_SHARED_PROCESSORS: Final[tuple[Any, ...]] = (
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.ExtraAdder(),
+    CachedTimeStamper(fmt=LOG_DT_FMT),
+)
 
 
 def init(loglevel_name: str = "INFO", logfile: Path | None = None) -> None:
@@ -68,31 +158,17 @@ def init(loglevel_name: str = "INFO", logfile: Path | None = None) -> None:
     if logfile:
         logfile = Path(logfile).resolve()
 
-    # get the default level or use the given one and convert it string to a level
-    loglevel: int | None = None
-    if loglevel_name:
-        loglevel = loglevel_from_str(loglevel_name)
-
-    # Check the level in case a the loglevel_name is not valid
-    if not loglevel:
-        loglevel = loglevel_from_str(LOG_LVL)
-
-    timestamper = structlog.processors.TimeStamper(fmt=LOG_DT_FMT, utc=True)
-    shared_processors: list[Any] = [
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.ExtraAdder(),
-        timestamper,
-    ]
+    # Convert the given level name to its level, using the default when not valid.
+    loglevel = _LEVELS.get((loglevel_name or LOG_LVL).strip().upper(), _LEVELS[LOG_LVL])
 
-    if sys.stderr.isatty():
-        _init_cli_logger(loglevel, shared_processors, logfile)
+    if _STDERR_ISATTY:
+        _init_cli_logger(loglevel, _SHARED_PROCESSORS, logfile)
     else:
-        _init_container_logger(loglevel, shared_processors, logfile)
+        _init_container_logger(loglevel, _SHARED_PROCESSORS, logfile)
 
 
 def _init_cli_logger(
-    loglevel: int, shared_processors: list[Any], logfile: Path | None
+    loglevel: int, shared_processors: Sequence[Any], logfile: Path | None
 ) -> None:
     """Setup logger for interactive command lines."""
 
@@ -148,57 +224,121 @@ def _init_cli_logger(
 
     logging.config.dictConfig(logconfig)
 
-    shared_processors = [
-        structlog.stdlib.add_log_level,
-    ] + shared_processors
-
     structlog.configure(
-        processors=shared_processors
-        + [
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.StackInfoRenderer(),
-            # structlog.processors.format_exc_info,
+        processors=[
+            *shared_processors,
+            # Exceptions are rendered by the `ConsoleRenderer`, `stack_info` is not
+            # used so `StackInfoRenderer` is left out.
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Methods below the level are no-ops, skipping the processors entirely.
+        wrapper_class=structlog.make_filtering_bound_logger(loglevel),
         cache_logger_on_first_use=True,
     )
 
 
 def _init_container_logger(
-    loglevel: int, shared_processors: list[Any], logfile: Path | None
+    loglevel: int, shared_processors: Sequence[Any], logfile: Path | None
 ) -> None:
-    """Setup logger for use in a container, ie wrapped in a program."""
-    formatter = StuctlogJsonFormatter(LOG_FMT)
+    """
+    Setup logger for use in a container, ie wrapped in a program.
+
+    Events are serialised to JSON, see `_load_json_serializer`, and written as bytes
+    to `stdout`, or as text when it has no binary buffer, skipping the stdlib `logging`
+    handlers and formatters. Records of
+    stdlib loggers, e.g. from libraries, are written as JSON by the root handler.
+    """
+
+    # Added to the structlog events and the stdlib records alike.
+    event_processors: list[Any] = [
+        structlog.processors.CallsiteParameterAdder(
+            [
+                structlog.processors.CallsiteParameter.PATHNAME,
+                structlog.processors.CallsiteParameter.LINENO,
+            ]
+        ),
+        _add_static_fields,
+    ]
+
     handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
+    handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            foreign_pre_chain=[*shared_processors, *event_processors],
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.format_exc_info,
+                structlog.processors.EventRenamer("message"),
+                structlog.processors.JSONRenderer(
+                    serializer=_load_json_serializer(decode=True)
+                ),
+            ],
+        )
+    )
 
     root_logger = logging.getLogger()
     root_logger.setLevel(loglevel)
     root_logger.addHandler(handler)
 
-    shared_processors = [
-        structlog.stdlib.add_log_level,
-    ] + shared_processors
+    # Text streams without a binary buffer, like `io.StringIO`, are written as text.
+    logger_factory: NamedBytesLoggerFactory
+    if (buffer := getattr(sys.stdout, "buffer", None)) is not None:
+        logger_factory = NamedBytesLoggerFactory(buffer)
+        serializer = _load_json_serializer()
+    else:
+        logger_factory = NamedWriteLoggerFactory(sys.stdout)
+        serializer = _load_json_serializer(decode=True)
 
     structlog.configure(
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        # logger_factory=structlog.BytesLoggerFactory(),
+        logger_factory=logger_factory,
         wrapper_class=structlog.make_filtering_bound_logger(loglevel),
         cache_logger_on_first_use=True,
         context_class=dict,
-        processors=shared_processors
-        + [
+        processors=[
+            *shared_processors,
             structlog.contextvars.merge_contextvars,
+            *event_processors,
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.stdlib.render_to_log_kwargs,
-            # structlog.processors.JSONRenderer(serializer=json.dumps),
+            structlog.processors.EventRenamer("message"),
+            structlog.processors.JSONRenderer(serializer=serializer),
         ],
     )
 
 
+def _add_static_fields(_: Any, __: Any, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """
+    Add the process id and host name, and write the level in upper case like the
+    stdlib `levelname`.
+    """
+    level: str = event_dict["level"]
+    event_dict["level"] = _LEVEL_UPPER.get(level) or level.upper()
+    event_dict["pid"] = _PID
+    event_dict["host"] = _HOST
+
+    return event_dict
+
+
+def _load_json_serializer(decode: bool = False) -> Callable[..., bytes | str]:
+    """
+    Load `orjson` to serialise the JSON logs, decoded to a `str` for text streams.
+
+    Imported here, as only the container logger needs it. Non-string keys are written
+    as strings, like `json.dumps` does, instead of raising a `TypeError`.
+    """
+    import orjson
+
+    dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+    if not decode:
+        return dumps
+
+    def dumps_str(obj: Any, **kwargs: Any) -> str:
+        """Serialise to a `str`, `orjson` only gives `bytes`."""
+        return dumps(obj, **kwargs).decode("utf-8")
+
+    return dumps_str
+
+
 def _load_colors() -> None:
     """
     Try and load `colorama` to support colourful exception printina on windows only.
@@ -215,9 +355,18 @@ def _load_colors() -> None:
         pass
 
 
+def default_log_file() -> Path:
+    """
+    Return the default log file, named by today's date in the working directory.
+
+    Determined when called, not on import, so it follows the current date.
+    """
+    return Path.cwd() / datetime.date.today().strftime(f"{__package__} %Y-%m-%d.log")
+
+
 def loglevel_from_str(loglevel: str) -> int | None:
-    """Convert the level string to its integer."""
-    return getattr(logging, loglevel, None)
+    """Convert the level string to its integer, `None` when it is not a level."""
+    return _LEVELS.get(loglevel)
 
 
 def _extract_from_record(_: Any, __: Any, event_dict: dict[str, Any]) -> dict[str, Any]:
@@ -231,9 +380,14 @@ def _extract_from_record(_: Any, __: Any, event_dict: dict[str, Any]) -> dict[st
     return event_dict
 
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
-    """Helper to get an initialised logger."""
-    if not structlog.is_configured():
+def get_logger(name: str) -> FilteringBoundLogger:
+    """Helper to get an initialised logger, reusing the logger for the same name."""
+    if logger := _LOGGERS.get(name):
+        return logger
+
+    if not _is_configured():
         init()
 
-    return structlog.get_logger(name)
+    logger = _LOGGERS[name] = _structlog_get_logger(name)
+
+    return logger
@@ -1,24 +1,31 @@
+import functools
+import linecache
+import os
+import stat
 from collections.abc import Callable, Iterable, Iterator, Mapping
 from pathlib import Path
 from types import GeneratorType
-from typing import Any
+from typing import Any, Final
+
+# Longest chain run by a single generated generator, see `chain_callables`.
+FUSED_CHAIN_MAX: Final[int] = 6
 
 
 def flag_first_in_loop(loop_over: Iterable) -> Iterator[tuple[Any, bool]]:
     """Loop over an iterable and flag it is the __first__ in the loop."""
-    it = iter(loop_over)
-    first = next(it)
-
-    yield first, True
-
-    for val in it:
-        yield val, False
+    for i, val in enumerate(loop_over):
+        yield val, i == 0
 
 
 def flag_last_in_loop(loop_over: Iterable) -> Iterator[tuple[Any, bool]]:
     """Loop over an iterable and flag it is the __last__ in the loop."""
     it = iter(loop_over)
-    prev = next(it)
+
+    # Look ahead one value, nothing to flag when empty.
+    for prev in it:
+        break
+    else:
+        return
 
     for val in it:
         yield prev, False
@@ -30,13 +37,17 @@ def flag_last_in_loop(loop_over: Iterable) -> Iterator[tuple[Any, bool]]:
 def flag_ends_in_loop(loop_over: Iterable) -> Iterator[tuple[Any, bool]]:
     """Loop over an iterable and flag if it is either the __first or the last__."""
     it = iter(loop_over)
-    first = next(it)
 
-    yield first, True
+    # Look ahead one value, nothing to flag when empty.
+    for prev in it:
+        break
+    else:
+        return
 
-    prev = next(it)
+    first = True
     for val in it:
-        yield prev, False
+        yield prev, first
+        first = False
         prev = val
 
     yield prev, True
@@ -47,17 +58,26 @@ def chain_callables(*functions: Callable) -> Callable:
 
     Each of the given functions is run in the passed order.
 
+    Up to `FUSED_CHAIN_MAX` functions are run by a single generated generator, see
+    `_fuse_callables`.
+
     RETURNS:
         A Callable which can be fed with an Iterable (List, Dict, Set, etc.) and runs
         all given functions over each element in that Iterable.
     """
 
+    if len(functions) <= FUSED_CHAIN_MAX:
+        return _fuse_callables(*functions)
+
+    # Generators are never subclassed, so an identity check on the type suffices.
+    _GeneratorType = GeneratorType
+
     def run_link(function: Callable, generator: Iterable[Any]) -> Iterable[Any]:
         """Helper to pass the generator to the function."""
         for item in generator:
             result: Any = function(item)
 
-            if isinstance(result, GeneratorType):
+            if type(result) is _GeneratorType:
                 yield from result
             else:
                 yield result
@@ -73,6 +93,99 @@ def chain_callables(*functions: Callable) -> Callable:
     return run_all_on
 
 
+def _fuse_callables(*functions: Callable) -> Callable:
+    """Run all functions over each element in a single generated generator.
+
+    The generator is compiled once per number of functions, see `_fused_chain`, only
+    the functions are bound per call.
+    """
+
+    return _fused_chain(len(functions))(*functions)
+
+
+@functools.lru_cache(maxsize=FUSED_CHAIN_MAX + 1)
+def _fused_chain(length: int) -> Callable[..., Callable]:
+    """Generate a factory binding `length` functions into a single generator.
+
+    Each function is called inline, with a branch iterating over its result when it
+    is a generator, e.g. for two functions:
+
+        def fuse(f0, f1):
+            def run_all_on(generator):
+                for x in generator:
+                    r0 = f0(x)
+                    if type(r0) is GeneratorType:
+                        for y0 in r0:
+                            r1 = f1(y0)
+                            ...
+                    else:
+                        r1 = f1(r0)
+                        ...
+
+            return run_all_on
+
+    This avoids a generator, and its frame, per function. As the code doubles with
+    each function, it is only used for short chains. The source is registered with
+    `linecache`, so tracebacks show the generated lines.
+    """
+
+    args: str = ", ".join(f"f{i}" for i in range(length))
+    lines: list[str] = [
+        f"def fuse({args}):",
+        "    def run_all_on(generator):",
+        "        for x in generator:",
+    ]
+
+    def add_call(i: int, arg: str, indent: str) -> None:
+        """Add the call to function `i`, and recursively those after it."""
+
+        if i == length:
+            lines.append(f"{indent}yield {arg}")
+            return
+
+        lines.append(f"{indent}r{i} = f{i}({arg})")
+        lines.append(f"{indent}if type(r{i}) is GeneratorType:")
+        lines.append(f"{indent}    for y{i} in r{i}:")
+        add_call(i + 1, f"y{i}", indent + " " * 8)
+        lines.append(f"{indent}else:")
+        add_call(i + 1, f"r{i}", indent + " " * 4)
+
+    add_call(0, "x", " " * 12)
+    lines.append("    return run_all_on")
+
+    source: str = "\n".join(lines) + "\n"
+    filename: str = f"<chain_callables, {length} functions>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    namespace: dict[str, Any] = {"GeneratorType": GeneratorType}
+    exec(compile(source, filename, "exec"), namespace)
+
+    return namespace["fuse"]
+
+
+def chain_callables_simple(*functions: Callable) -> Callable:
+    """Create a chain with callables which do not return generators.
+
+    Like `chain_callables`, but the results are not checked for generators, which
+    allows chaining `map` objects instead of generators. This skips the generator
+    frames and is about twice as fast.
+
+    RETURNS:
+        A Callable which can be fed with an Iterable (List, Dict, Set, etc.) and runs
+        all given functions over each element in that Iterable.
+    """
+
+    def run_all_on(generator: Iterable[Any]) -> Iterable[Any]:
+        """Run all the functions in order over the passed Iterable."""
+
+        for function in functions:
+            generator = map(function, generator)
+
+        return generator
+
+    return run_all_on
+
+
 def merge_dicts(d1: dict[str, Any], d2: dict[str, Any]) -> None:
     """
     Add dict `d2` to dict `d1`.
@@ -89,18 +202,48 @@ def merge_dicts(d1: dict[str, Any], d2: dict[str, Any]) -> None:
 
 
 def expand_path(fn: Path) -> Path:
-    """Expand and return and absolute path."""
+    """
+    Expand and return and absolute path.
+
+    Symlinks are not resolved, see `os.path.abspath`.
+    """
 
     if fn.is_absolute():
         return fn
 
-    return fn.expanduser().resolve()
+    return Path(os.path.abspath(os.path.expanduser(fn)))
+
+
+def stat_or_none(fn: Path | str) -> os.stat_result | None:
+    """Return the `os.stat` result, or `None` when it fails, e.g. when not existing."""
+
+    try:
+        return os.stat(fn)
+    except OSError:
+        return None
 
 
 def filter_paths(*files: Path | str) -> list[Path]:
-    """Return a list of unique existing Paths."""
+    """
+    Return a list of unique existing files as Paths.
+
+    See `filter_paths_with_stat`, which also returns the `os.stat` results.
+    """
+
+    return [fn for fn, _ in filter_paths_with_stat(*files)]
 
-    fns: list = []
+
+def filter_paths_with_stat(*files: Path | str) -> list[tuple[Path, os.stat_result]]:
+    """
+    Return a list of unique existing files as Paths, each with its `os.stat` result.
+
+    Each path is checked with a single `os.stat`, uniqueness is by device and inode
+    so links to an already listed file are skipped. Repeated paths are skipped before
+    the `os.stat`.
+    """
+
+    found: list[tuple[Path, os.stat_result]] = []
+    seen: set[str | tuple[int, int]] = set()
     for fn in files:
         try:
             fn = expand_path(fn)
@@ -108,7 +251,16 @@ def filter_paths(*files: Path | str) -> list[Path]:
             # Done to prevent having to check if the instance is a Path object.
             fn = expand_path(Path(fn))
 
-        if fn not in fns and fn.exists():
-            fns.append(fn)
+        if (name := os.fspath(fn)) in seen:
+            continue
+
+        seen.add(name)
+
+        if (st := stat_or_none(fn)) is None or not stat.S_ISREG(st.st_mode):
+            continue
+
+        if (inode := (st.st_dev, st.st_ino)) not in seen:
+            seen.add(inode)
+            found.append((fn, st))
 
-    return fns
+    return found
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import dotenv
+import pytest
+
+from tomato import etc
+
+
+@pytest.fixture
+def dotenv_fn(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Point the dotenv search to a temporary file and record the searches."""
+    fn = tmp_path / ".tomato.env"
+    fn.write_text(f"{etc.OS_ENV_KEY}=one.toml;two.toml\n")
+
+    searches: list[str] = []
+
+    def find_dotenv(filename: str) -> str:
+        searches.append(filename)
+        return str(fn)
+
+    monkeypatch.setattr(dotenv, "find_dotenv", find_dotenv)
+    # Set before deleting, so the teardown also removes the value set from the dotenv.
+    monkeypatch.setenv(etc.OS_ENV_KEY, "")
+    monkeypatch.delenv(etc.OS_ENV_KEY)
+    etc._dotenv_values.cache_clear()
+
+    yield searches
+
+    etc._dotenv_values.cache_clear()
+
+
+@pytest.mark.etc
+def test_files_from_dotenv(dotenv_fn: list[str]) -> None:
+    """The key is read from the dotenv file when not in the environment."""
+    assert etc._files_from_env() == [Path("one.toml"), Path("two.toml")]
+    assert dotenv_fn == [etc.DOTENV_FILE]
+
+
+@pytest.mark.etc
+def test_dotenv_searched_once(
+    dotenv_fn: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The dotenv file is searched for and parsed only once."""
+    etc._files_from_env()
+    monkeypatch.delenv(etc.OS_ENV_KEY)
+    etc._files_from_env()
+
+    assert dotenv_fn == [etc.DOTENV_FILE]
+
+
+@pytest.mark.etc
+def test_files_from_environ(
+    dotenv_fn: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """No dotenv file is searched for when the key is in the environment."""
+    monkeypatch.setenv(etc.OS_ENV_KEY, "three.toml")
+
+    assert etc._files_from_env() == [Path("three.toml")]
+    assert dotenv_fn == []
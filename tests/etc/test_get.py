@@ -155,3 +155,26 @@ def test_get_empty_defs(etc_data: ..., defaults: ...) -> None:
 def test_get_named_keys(etc_data: ..., keys: ...) -> None:
     with pytest.raises(TypeError):
         etc.get(keys=keys)
+
+
+@pytest.mark.etc
+def test_get_digit_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Digit keys are an index only for arrays."""
+    monkeypatch.setattr(etc, "data", {"table": {"1": "one"}, "array": ["zero"]})
+
+    assert etc.get("table.1") == "one"
+    assert etc.get("table", "1") == "one"
+    assert etc.get("array.0") == "zero"
+    assert etc.get("array", "0") == "zero"
+
+
+@pytest.mark.etc
+def test_get_changed_data(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Changes made directly to `etc.data` are returned."""
+    monkeypatch.setattr(etc, "data", {"logging": {"level": "INFO"}})
+
+    assert etc.get("logging.level") == "INFO"
+
+    etc.data["logging"]["level"] = "DEBUG"
+
+    assert etc.get("logging.level") == "DEBUG"
@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from tomato import etc
+
+
+@pytest.fixture
+def etc_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Only load a single, temporary, configuration file."""
+    fn = tmp_path / "etc.toml"
+    fn.write_text('[table]\nfoo = "bar"\n')
+
+    monkeypatch.setattr(etc, "_gather_files", lambda: [fn])
+    monkeypatch.setattr(etc, "data", None)
+    monkeypatch.setattr(etc, "_LAST_FINGERPRINT", None)
+
+    return fn
+
+
+@pytest.fixture
+def load_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[Path, ...]]:
+    """Record the calls to `etc._load_files`."""
+    calls: list[tuple[Path, ...]] = []
+    load_files = etc._load_files
+
+    def record(*files: Path, **kwargs) -> ...:
+        calls.append(files)
+        return load_files(*files, **kwargs)
+
+    monkeypatch.setattr(etc, "_load_files", record)
+
+    return calls
+
+
+@pytest.mark.etc
+def test_init_unchanged(etc_file: Path, load_calls: list) -> None:
+    """Files are not loaded again when unchanged."""
+    etc.init()
+    etc.init()
+
+    assert len(load_calls) == 1
+    assert etc.get("table.foo") == "bar"
+
+
+@pytest.mark.etc
+def test_init_changed(etc_file: Path, load_calls: list) -> None:
+    """Changed files are loaded again."""
+    etc.init()
+    etc_file.write_text('[table]\nfoo = "baz, longer"\n')
+    etc.init()
+
+    assert len(load_calls) == 2
+    assert etc.get("table.foo") == "baz, longer"
+
+
+@pytest.mark.etc
+def test_init_reload(etc_file: Path, load_calls: list) -> None:
+    """Files are always loaded with `reload=True`."""
+    etc.init()
+    etc.init(reload=True)
+
+    assert len(load_calls) == 2
+
+
+@pytest.mark.etc
+def test_init_single_stat(
+    etc_file: Path, load_calls: list, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Each file is stat'ed once per load."""
+    stats: list = []
+    os_stat = os.stat
+
+    def record(fn, *args, **kwargs) -> ...:
+        stats.append(fn)
+        return os_stat(fn, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", record)
+
+    etc.init(reload=True)
+
+    assert stats.count(etc_file) == 1
+    assert etc.get("table.foo") == "bar"
@@ -0,0 +1,75 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from tomato import etc
+
+
+@pytest.fixture
+def etc_file(tmp_path: Path) -> Path:
+    """Write a small configuration file and clear the parse cache."""
+    etc._PARSE_CACHE.clear()
+
+    fn = tmp_path / "etc.toml"
+    fn.write_text('[table]\nfoo = "bar"\n')
+
+    return fn
+
+
+@pytest.mark.etc
+def test_load_file_cached(etc_file: Path) -> None:
+    """An unchanged file is parsed once and returned as a copy."""
+    first = etc._load_file(etc_file)
+    first["table"]["foo"] = "changed"
+
+    assert etc_file in etc._PARSE_CACHE
+    assert etc._load_file(etc_file)["table"]["foo"] == "bar"
+
+
+@pytest.mark.etc
+def test_load_file_changed(etc_file: Path) -> None:
+    """A changed file is parsed again."""
+    etc._load_file(etc_file)
+
+    etc_file.write_text('[table]\nfoo = "baz, longer"\n')
+    st = os.stat(etc_file)
+    os.utime(etc_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert etc._load_file(etc_file)["table"]["foo"] == "baz, longer"
+
+
+@pytest.mark.etc
+def test_load_files_merged(etc_file: Path) -> None:
+    """Tables of later files are merged into those of earlier files."""
+    later = etc_file.with_name("later.toml")
+    later.write_text('[table]\nbaz = 13\n\n[table2]\nfoo = "bar"\n')
+
+    assert etc._load_files(etc_file, later) == {
+        "table": {"foo": "bar", "baz": 13},
+        "table2": {"foo": "bar"},
+    }
+    assert etc._load_file(etc_file) == {"table": {"foo": "bar"}}
+
+
+@pytest.mark.etc
+def test_load_files_unreadable(etc_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Unreadable files are skipped, even when it is the first file found."""
+    unreadable = etc_file.with_name("unreadable.toml")
+    load_file = etc._load_file
+
+    def deny(fn: Path, *args) -> ...:
+        if fn == unreadable:
+            raise PermissionError(fn)
+        return load_file(fn, *args)
+
+    monkeypatch.setattr(etc, "_load_file", deny)
+
+    assert etc._load_files(etc_file, unreadable) == {"table": {"foo": "bar"}}
+    assert etc._load_files(unreadable, etc_file) == {"table": {"foo": "bar"}}
+
+    # Except for the defaults file.
+    monkeypatch.setattr(etc, "_DEFAULT_FILE_PATH", unreadable)
+
+    with pytest.raises(PermissionError):
+        etc._load_files(unreadable, etc_file)
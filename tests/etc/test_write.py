@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import pytest
+
+from tomato import etc
+
+
+@pytest.mark.etc
+def test_write_loaded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Written data loads back as the same data."""
+    monkeypatch.setattr(etc, "data", {"logging": {"level": "INFO"}, "array": [1, 2]})
+    fn = tmp_path / "etc.toml"
+
+    etc.write(fn)
+
+    assert etc._load_file(fn) == etc.data
+
+
+@pytest.mark.etc
+def test_write_no_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Writing to a missing directory raises."""
+    monkeypatch.setattr(etc, "data", {})
+
+    with pytest.raises(FileNotFoundError):
+        etc.write(tmp_path / "missing" / "etc.toml")
@@ -0,0 +1,23 @@
+import time
+
+import pytest
+
+from tomato import log
+
+
+@pytest.mark.log
+def test_cached_time_stamper(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The timestamp is formatted once per second."""
+    now = 1_700_000_000.25
+    monkeypatch.setattr(time, "time", lambda: now)
+    stamper = log.CachedTimeStamper()
+
+    first = stamper(None, "info", {})["timestamp"]
+    now += 0.5
+    second = stamper(None, "info", {})["timestamp"]
+    now += 1
+    third = stamper(None, "info", {})["timestamp"]
+
+    assert first == "2023-11-14 22:13:20"
+    assert second is first
+    assert third == "2023-11-14 22:13:21"
@@ -0,0 +1,106 @@
+import io
+import logging
+import os
+import sys
+
+import orjson
+import pytest
+import structlog
+
+from tomato import log
+
+
+@pytest.fixture
+def stdout(monkeypatch: pytest.MonkeyPatch) -> io.BytesIO:
+    """Capture the bytes written to `stdout` by a container logger."""
+    buffer = io.BytesIO()
+    # Keep a reference, closing the wrapper closes the buffer too.
+    wrapper = io.TextIOWrapper(buffer)
+    monkeypatch.setattr(sys, "stdout", wrapper)
+
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers[:], root_logger.level
+
+    log._init_container_logger(logging.INFO, log._SHARED_PROCESSORS, None)
+
+    yield buffer
+
+    structlog.reset_defaults()
+    root_logger.handlers[:] = handlers
+    root_logger.setLevel(level)
+    wrapper.detach()
+
+
+@pytest.mark.log
+def test_container_logger_json(stdout: io.BytesIO) -> None:
+    """Each event is written as a line of JSON."""
+    structlog.get_logger("tomato.test").info("Hello", answer=42)
+
+    record = orjson.loads(stdout.getvalue().splitlines()[0])
+
+    assert record["message"] == "Hello"
+    assert record["answer"] == 42
+    assert record["level"] == "INFO"
+    assert record["logger"] == "tomato.test"
+    assert record["pathname"] == __file__
+    assert record["pid"] == os.getpid()
+    assert "host" in record
+
+
+@pytest.mark.log
+def test_container_logger_level(stdout: io.BytesIO) -> None:
+    """Events below the level are not written."""
+    structlog.get_logger("tomato.test").debug("Hello")
+
+    assert stdout.getvalue() == b""
+
+
+@pytest.mark.log
+def test_container_logger_non_str_keys(stdout: io.BytesIO) -> None:
+    """Non-string keys are written as strings."""
+    structlog.get_logger("tomato.test").info("Hello", d={1: "a"})
+
+    record = orjson.loads(stdout.getvalue().splitlines()[0])
+
+    assert record["d"] == {"1": "a"}
+
+
+@pytest.mark.log
+def test_container_logger_stdlib(stdout: io.BytesIO) -> None:
+    """Records of stdlib loggers are written as JSON too, from the level on."""
+    logger = logging.getLogger("tomato.test.stdlib")
+    logger.debug("Hidden")
+    logger.info("Hello %s", "world")
+
+    lines = stdout.getvalue().splitlines()
+    record = orjson.loads(lines[0])
+
+    assert len(lines) == 1
+    assert record["message"] == "Hello world"
+    assert record["level"] == "INFO"
+    assert record["logger"] == "tomato.test.stdlib"
+    assert record["pathname"] == __file__
+    assert record["pid"] == os.getpid()
+
+
+@pytest.mark.log
+def test_container_logger_text_stdout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A `stdout` without a binary buffer is written to as text."""
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    root_logger = logging.getLogger()
+    monkeypatch.setattr(root_logger, "handlers", [])
+    monkeypatch.setattr(root_logger, "level", root_logger.level)
+
+    log._init_container_logger(logging.INFO, log._SHARED_PROCESSORS, None)
+    try:
+        structlog.get_logger("tomato.test").info("Hello", answer=42)
+        logging.getLogger("tomato.test.stdlib").warning("World")
+    finally:
+        structlog.reset_defaults()
+
+    records = [orjson.loads(line) for line in stdout.getvalue().splitlines()]
+
+    assert [r["message"] for r in records] == ["Hello", "World"]
+    assert records[0]["logger"] == "tomato.test"
+    assert records[0]["answer"] == 42
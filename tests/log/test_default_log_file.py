@@ -0,0 +1,26 @@
+import datetime
+from pathlib import Path
+
+import pytest
+
+from tomato import log
+
+
+@pytest.mark.log
+def test_default_log_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Named by the package and the date when called, in the working directory."""
+    today = datetime.date(2023, 1, 2)
+
+    class FixedDate(datetime.date):
+        @classmethod
+        def today(cls) -> datetime.date:
+            return today
+
+    monkeypatch.setattr(datetime, "date", FixedDate)
+    monkeypatch.chdir(tmp_path)
+
+    assert log.default_log_file() == tmp_path / "tomato 2023-01-02.log"
+
+    today = datetime.date(2023, 1, 3)
+
+    assert log.default_log_file() == tmp_path / "tomato 2023-01-03.log"
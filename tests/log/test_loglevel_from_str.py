@@ -0,0 +1,54 @@
+import logging
+
+import pytest
+
+from tomato import log
+
+
+@pytest.mark.log
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("DEBUG", logging.DEBUG),
+        ("INFO", logging.INFO),
+        ("WARN", logging.WARNING),
+        ("CRITICAL", logging.CRITICAL),
+    ],
+)
+def test_loglevel_from_str(value: str, expected: int) -> None:
+    """Level names give their integer."""
+    assert log.loglevel_from_str(value) == expected
+
+
+@pytest.mark.log
+@pytest.mark.parametrize("value", ["NOTSET", "Logger", "debug", "getLogger", ""])
+def test_loglevel_from_str_faulty(value: str) -> None:
+    """Anything else, even other attributes of `logging`, gives `None`."""
+    assert log.loglevel_from_str(value) is None
+
+
+@pytest.mark.log
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("DEBUG", logging.DEBUG),
+        (" warning ", logging.WARNING),
+        ("NOTSET", logging.INFO),
+        ("", logging.INFO),
+    ],
+)
+def test_init_loglevel(
+    value: str, expected: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """`init` accepts level names in any case, else falls back to `LOG_LVL`."""
+    levels: list[int] = []
+
+    monkeypatch.setattr(log.structlog, "is_configured", lambda: False)
+    monkeypatch.setattr(log, "_STDERR_ISATTY", False)
+    monkeypatch.setattr(
+        log, "_init_container_logger", lambda level, *_: levels.append(level)
+    )
+
+    log.init(value)
+
+    assert levels == [expected]
@@ -37,6 +37,40 @@ def test_callable_chain_raise() -> None:
         _ = list(chain(range(n)))
 
 
+@pytest.mark.utils
+@pytest.mark.parametrize("n", [0, 1, utils.FUSED_CHAIN_MAX, utils.FUSED_CHAIN_MAX + 1])
+def test_callable_chain_lengths(n: int) -> None:
+    """Short, generated, and long chains give the same output."""
+
+    chain = utils.chain_callables(plus, *[duplicate] * n)
+    output = list(chain(range(2)))
+    expected = [x + 1 for x in range(2) for _ in range(2**n)]
+
+    assert output == expected
+
+
+@pytest.mark.utils
+def test_callable_chain_compiled_once() -> None:
+    """Chains of the same length share the generated code, not the functions."""
+    first = utils.chain_callables(sq, plus)
+    second = utils.chain_callables(plus, sq)
+
+    assert first.__code__ is second.__code__
+    assert list(first(range(3))) == [1, 2, 5]
+    assert list(second(range(3))) == [1, 4, 9]
+
+
+@pytest.mark.utils
+def test_callable_chain_simple() -> None:
+    """Same output as a chain checking for generators."""
+
+    chain = utils.chain_callables_simple(sq, plus, twice)
+    output = list(chain(range(5)))
+    expected = list(utils.chain_callables(sq, plus, twice)(range(5)))
+
+    assert output == expected
+
+
 def sq(x: int) -> int:
     """Test helper: square"""
     return x * x
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+
+from tomato import utils
+
+
+@pytest.mark.utils
+def test_filter_paths(tmp_path: Path) -> None:
+    """Only existing files are returned, once and in order."""
+    first = tmp_path / "first.toml"
+    second = tmp_path / "second.toml"
+    link = tmp_path / "link.toml"
+    first.touch()
+    second.touch()
+    link.symlink_to(first)
+
+    output = utils.filter_paths(
+        second, str(first), tmp_path / "missing.toml", tmp_path, link, second
+    )
+
+    assert output == [second, first]
+
+
+@pytest.mark.utils
+def test_stat_or_none(tmp_path: Path) -> None:
+    """Missing files give `None`."""
+    assert utils.stat_or_none(tmp_path) is not None
+    assert utils.stat_or_none(tmp_path / "missing.toml") is None
+
+
+@pytest.mark.utils
+def test_filter_paths_repeated(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeated paths are not checked again."""
+    fn = tmp_path / "etc.toml"
+    fn.touch()
+
+    checked: list[Path] = []
+    stat_or_none = utils.stat_or_none
+
+    def record(fn: Path) -> ...:
+        checked.append(fn)
+        return stat_or_none(fn)
+
+    monkeypatch.setattr(utils, "stat_or_none", record)
+
+    assert utils.filter_paths(fn, str(fn), fn) == [fn]
+    assert checked == [fn]
@@ -37,3 +37,20 @@ def test_ends_in_loop():
     expected = [[0, True], [1, False], [2, True]]
 
     assert output == expected
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize(
+    "flag_in_loop",
+    [utils.flag_first_in_loop, utils.flag_last_in_loop, utils.flag_ends_in_loop],
+)
+def test_short_loops(flag_in_loop) -> None:
+    """Empty and single value loops, which are both the first and the last."""
+    assert list(flag_in_loop([])) == []
+    assert list(flag_in_loop(iter([0]))) == [(0, True)]
+
+
+@pytest.mark.utils
+def test_ends_in_loop_pair():
+    """Both values of a pair are at an end."""
+    assert list(utils.flag_ends_in_loop(range(2))) == [(0, True), (1, True)]